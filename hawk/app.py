@@ -1,21 +1,110 @@
 """Hawk TUI - Main Textual application."""
 
 from textual.app import App, ComposeResult
-from textual.containers import Container, Vertical, Horizontal
+from textual.containers import Container
 from textual.widgets import Header, Footer, Input, Static
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.message import Message
 from textual import work
+from textual.worker import get_current_worker
+from textual.geometry import Region
+from textual.timer import Timer
 from rich.text import Text
 from rich.panel import Panel
+from rich.style import Style
+from rich.cells import cell_len
 from pathlib import Path
-
-from hawk.config import PROJECTS, COLORS, Project, USE_OLLAMA, USE_LOCAL_IMAGE_GEN, VERBOSE
-from hawk import image_generator, video
+import asyncio
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from itertools import compress
+from collections import deque
+
+from hawk.config import PROJECTS, COLORS, Project, USE_OLLAMA, USE_LOCAL_IMAGE_GEN
+from hawk import image_generator
 from hawk.logger import logger
+from hawk.process import spawn_detached
 from hawk.screens.splash import SplashScreen
-from hawk.screens.captions import CaptionEditor
+
+# Markup fragments used by render paths, built once from the palette
+_ACCENT_TAG = f"[{COLORS['accent']}]"
+_BOLD_ACCENT_TAG = f"[bold {COLORS['accent']}]"
+_DIM_TAG = f"[{COLORS['dim']}]"
+_CURSOR_MARK = f"[bold {COLORS['accent']}]▶[/]"
+_SELECT_MARK = "[green]✓[/]"
+# Row prefix for each (cursor, selected) combination, indexed cursor*2 + selected
+_ROW_PREFIXES = tuple(
+    (_CURSOR_MARK if cur else " ") + (_SELECT_MARK if sel else " ")
+    for cur in (False, True)
+    for sel in (False, True)
+)
+_ROW_NAME_TMPL = "[{:2}] {}"
+_BORDER = COLORS["border"]
+
+# Status bar styles, parsed once rather than per update
+_STYLE_WORKING = Style.parse(f"bold {COLORS['accent']}")
+_STYLE_OK = Style.parse(COLORS["success"])
+
+# Generation progress bars, one per 10% step
+_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+# ProjectSelector rows in both states; PROJECTS is fixed at import
+_PROJECT_ROWS_SELECTED = {
+    slug: f"{_BOLD_ACCENT_TAG}▶ [{i}] {proj.name}[/]"
+    for i, (slug, proj) in enumerate(PROJECTS.items(), 1)
+}
+_PROJECT_ROWS_UNSELECTED = {
+    slug: f"  {_DIM_TAG}[{i}][/] {proj.name}"
+    for i, (slug, proj) in enumerate(PROJECTS.items(), 1)
+}
+
+
+_PROJECTS_TITLE = Text.from_markup("[bold]PROJECTS[/]")
+
+
+# PROJECTS and COLORS are static, so a panel per selection never goes stale.
+# Body and title are parsed to Text here so Rich doesn't re-parse the
+# markup each time the cached panel is drawn.
+@lru_cache(maxsize=8)
+def _build_project_panel(selected: str) -> Panel:
+    """Build the ProjectSelector panel with ``selected`` highlighted."""
+    body = "\n".join(
+        _PROJECT_ROWS_SELECTED[slug] if slug == selected else _PROJECT_ROWS_UNSELECTED[slug]
+        for slug in PROJECTS
+    )
+    return Panel(Text.from_markup(body), title=_PROJECTS_TITLE, border_style=_BORDER)
+
+
+# Right-hand help panel; fully static, so joined once at import
+_HELP_TEXT = "\n".join((
+    "[bold]Navigation[/]",
+    f"{_ACCENT_TAG}↑/↓[/] Move cursor",
+    f"{_ACCENT_TAG}Tab[/] Switch panels",
+    f"{_ACCENT_TAG}Enter[/] Select/Open",
+    "",
+    "[bold]Images[/]",
+    f"{_ACCENT_TAG}Space[/] Toggle select",
+    f"{_ACCENT_TAG}a[/] Select all",
+    f"{_ACCENT_TAG}p[/] Preview (chafa)",
+    f"{_ACCENT_TAG}Esc[/] Clear selection",
+    "",
+    "[bold]Actions[/]",
+    f"{_ACCENT_TAG}v[/] Create video + captions",
+    f"{_ACCENT_TAG}b[/] Browse folder",
+    f"{_ACCENT_TAG}d[/] Delete selected",
+    f"{_ACCENT_TAG}l[/] View logs",
+    "",
+    "[bold]Projects[/]",
+    f"{_ACCENT_TAG}1[/] Wedding Vision",
+    f"{_ACCENT_TAG}2[/] Latin Bible",
+    f"{_ACCENT_TAG}3[/] DXP Labs",
+    "",
+    f"{_ACCENT_TAG}q[/] Quit",
+))
 
 
 class ProjectSelector(Static, can_focus=True):
@@ -23,6 +112,7 @@ class ProjectSelector(Static, can_focus=True):
 
     selected = reactive("dxp-labs")
     _project_slugs = list(PROJECTS.keys())
+    _slug_to_idx = {slug: i for i, slug in enumerate(PROJECTS)}
 
     BINDINGS = [
         Binding("up", "move_up", "Up", priority=True),
@@ -34,14 +124,14 @@ class ProjectSelector(Static, can_focus=True):
 
     def action_move_up(self) -> None:
         """Move to previous project."""
-        idx = self._project_slugs.index(self.selected)
+        idx = self._slug_to_idx[self.selected]
         if idx > 0:
             self.selected = self._project_slugs[idx - 1]
             self.post_message(self.Changed(self.selected))
 
     def action_move_down(self) -> None:
         """Move to next project."""
-        idx = self._project_slugs.index(self.selected)
+        idx = self._slug_to_idx[self.selected]
         if idx < len(self._project_slugs) - 1:
             self.selected = self._project_slugs[idx + 1]
             self.post_message(self.Changed(self.selected))
@@ -63,25 +153,14 @@ class ProjectSelector(Static, can_focus=True):
             self.value = value
 
     def render(self) -> Panel:
-        lines = []
-        for i, (slug, proj) in enumerate(PROJECTS.items(), 1):
-            if slug == self.selected:
-                line = f"[bold {COLORS['accent']}]▶ [{i}] {proj.name}[/]"
-            else:
-                line = f"  [{COLORS['dim']}][{i}][/] {proj.name}"
-            lines.append(line)
-
-        return Panel(
-            "\n".join(lines),
-            title="[bold]PROJECTS[/]",
-            border_style=COLORS["border"],
-        )
+        return _build_project_panel(self.selected)
 
 
 class ImageList(Static, can_focus=True):
     """Display list of images in current project."""
 
-    cursor = reactive(0)
+    # watch_cursor feeds the throttled flush below instead of repainting directly
+    cursor = reactive(0, repaint=False)
 
     BINDINGS = [
         Binding("up", "move_up", "Up", priority=True),
@@ -96,86 +175,192 @@ class ImageList(Static, can_focus=True):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._images: list[Path] = []
-        self._selected: set[int] = set()
+        # One byte per image (1 = selected); iterating it yields index order
+        self._selected_bits = bytearray()
+        self._selected_count = 0
+        self._sorted_selected_cache: list[int] | None = None
+        self._name_strs: list[str] = []
+        # Formatted rows for the visible window only (at most 18)
+        self._ring: deque[str] = deque(maxlen=18)
+        # Set by key handlers; a 30 Hz timer turns it into a single redraw so
+        # key-repeat bursts don't queue up a repaint per event
+        self._dirty = False
+        # Row regions to repaint when the window did not scroll
+        self._pending_regions: list[Region] = []
+        self._window_start = 0
+        # Cell width of the widest row (marks + number + name)
+        self._row_width = 0
+
+    def on_mount(self) -> None:
+        """Start the redraw throttle."""
+        self.set_interval(1 / 30, self._flush_if_dirty)
+
+    def _flush_if_dirty(self) -> None:
+        """Redraw once if anything changed since the last tick."""
+        if self._dirty:
+            self._dirty = False
+            self._pending_regions.clear()
+            self.refresh()
+        elif self._pending_regions:
+            self.refresh(*self._pending_regions)
+            self._pending_regions.clear()
+
+    def _invalidate_cursor_rows(self, *indices: int) -> None:
+        """Queue repaints for the given rows of an unscrolled window."""
+        width = self.size.width
+        # Row i is only on screen line i + 1 if no row wraps inside the
+        # panel (border and padding take 4 cells); otherwise redraw it all
+        if width - 4 < self._row_width:
+            self._dirty = True
+            return
+        # +1 skips the panel's top border
+        for i in indices:
+            self._pending_regions.append(Region(0, i - self._window_start + 1, width, 1))
+        if len(self._images) > 18:
+            # The "(n/total)" indicator follows the last visible row
+            visible = min(len(self._images) - self._window_start, 18)
+            self._pending_regions.append(Region(0, visible + 1, width, 1))
 
     def set_images(self, images: list[Path]) -> None:
         """Update the image list."""
-        self._images = images
-        self._selected = set()
+        # The app hands back the very same list on an mtime cache hit, in
+        # which case the names and formatted rows are still valid
+        if images is not self._images:
+            self._images = images
+            # Number + truncated name never change for a given list; read each
+            # Path.name once here so no render path touches the Path objects
+            names = [img.name for img in images]
+            display_names = [n if len(n) <= 35 else n[:32] + "..." for n in names]
+            fmt = _ROW_NAME_TMPL.format
+            self._name_strs = [fmt(i, n) for i, n in enumerate(display_names, 1)]
+            self._row_width = 2 + max(map(cell_len, self._name_strs), default=0)
+        self._selected_bits = bytearray(len(images))
+        self._selected_count = 0
+        self._sorted_selected_cache = None
+        # Empty ring tells watch_cursor this reset is not a one-step move
+        self._ring.clear()
         self.cursor = 0
+        self._rebuild_rows()
         self.refresh()
 
+    def _format_row(self, i: int) -> str:
+        """Build the markup for a single image row."""
+        # Selection bytes are 0/1, so they index the prefix table directly
+        return _ROW_PREFIXES[(i == self.cursor) * 2 + self._selected_bits[i]] + self._name_strs[i]
+
+    def _rebuild_rows(self) -> None:
+        """Re-render the whole window (images or whole selection changed)."""
+        start = max(0, self.cursor - 8)
+        end = min(len(self._images), start + 18)
+        self._window_start = start
+        self._ring = deque((self._format_row(i) for i in range(start, end)), maxlen=18)
+
+    def _update_rows(self, *indices: int) -> None:
+        """Re-render only the given rows, if they are in the window."""
+        for i in indices:
+            offset = i - self._window_start
+            if 0 <= offset < len(self._ring):
+                self._ring[offset] = self._format_row(i)
+
+    def watch_cursor(self, old: int, new: int) -> None:
+        """Update the window for cursor moves made by the actions."""
+        if self._ring:
+            self._follow_cursor(old)
+
+    def _follow_cursor(self, old: int) -> None:
+        """Update rows after a one-step cursor move, scrolling the ring if needed."""
+        start = max(0, self.cursor - 8)
+        if start == self._window_start:
+            self._update_rows(old, self.cursor)
+            self._invalidate_cursor_rows(old, self.cursor)
+            return
+
+        n = len(self._images)
+        old_end = min(n, self._window_start + 18)
+        if start > self._window_start:
+            if min(n, start + 18) > old_end:
+                # Full window: append evicts the old top row
+                self._ring.append(self._format_row(old_end))
+            else:
+                self._ring.popleft()
+        else:
+            # A full window evicts the old bottom row
+            self._ring.appendleft(self._format_row(start))
+        self._window_start = start
+        self._update_rows(old, self.cursor)
+        self._dirty = True
+
     def action_move_up(self) -> None:
         """Move cursor up."""
         if self._images and self.cursor > 0:
             self.cursor -= 1
-            self.refresh()
 
     def action_move_down(self) -> None:
         """Move cursor down."""
         if self._images and self.cursor < len(self._images) - 1:
             self.cursor += 1
-            self.refresh()
 
     def action_open_current(self) -> None:
         """Open current image."""
         if self._images and 0 <= self.cursor < len(self._images):
-            import subprocess
-            subprocess.Popen(["open", str(self._images[self.cursor])])
+            spawn_detached(["open", str(self._images[self.cursor])])
 
     def action_toggle_select(self) -> None:
         """Toggle selection of current image."""
         if self._images and 0 <= self.cursor < len(self._images):
-            if self.cursor in self._selected:
-                self._selected.discard(self.cursor)
-            else:
-                self._selected.add(self.cursor)
-            self.refresh()
+            self._selected_bits[self.cursor] ^= 1
+            self._selected_count += 1 if self._selected_bits[self.cursor] else -1
+            self._sorted_selected_cache = None
+            self._update_rows(self.cursor)
+            self._dirty = True
 
     def action_select_all(self) -> None:
         """Select all images."""
-        self._selected = set(range(len(self._images)))
-        self.refresh()
+        self._selected_bits = bytearray(b"\x01") * len(self._images)
+        self._selected_count = len(self._images)
+        self._sorted_selected_cache = None
+        self._rebuild_rows()
+        self._dirty = True
 
     def clear_selection(self) -> None:
         """Clear all selections."""
-        self._selected = set()
-        self.refresh()
+        self._selected_bits = bytearray(len(self._images))
+        self._selected_count = 0
+        self._sorted_selected_cache = None
+        self._rebuild_rows()
+        self._dirty = True
 
     @property
     def images(self) -> list[Path]:
         return self._images
 
     @property
-    def selected_indices(self) -> set[int]:
-        return self._selected
+    def selected_indices(self) -> list[int]:
+        """Selected indices in ascending order."""
+        return self.get_sorted_selected()
+
+    def get_sorted_selected(self) -> list[int]:
+        """Selected indices in ascending order, cached until the selection changes."""
+        if self._sorted_selected_cache is None:
+            # compress() walks the bitmap in C instead of a Python-level filter
+            self._sorted_selected_cache = list(compress(range(len(self._selected_bits)), self._selected_bits))
+        return self._sorted_selected_cache
 
     def render(self) -> Panel:
         if not self._images:
             content = f"[dim]No images yet.\n\nType a prompt below and press Enter to generate.[/]"
         else:
-            lines = []
-            start = max(0, self.cursor - 8)
-            end = min(len(self._images), start + 18)
-
-            for i in range(start, end):
-                img = self._images[i]
-                cursor_mark = f"[bold {COLORS['accent']}]▶[/]" if i == self.cursor else " "
-                select_mark = f"[green]✓[/]" if i in self._selected else " "
-                name = img.name[:32] + "..." if len(img.name) > 35 else img.name
-                lines.append(f"{cursor_mark}{select_mark}[{i+1:2}] {name}")
-
-            content = "\n".join(lines)
+            content = "\n".join(self._ring)
             if len(self._images) > 18:
                 content += f"\n[dim]({self.cursor + 1}/{len(self._images)})[/]"
 
-        selected_count = len(self._selected)
+        selected_count = self._selected_count
         title = f"[bold]IMAGES ({len(self._images)})"
         if selected_count > 0:
-            title += f" [{COLORS['accent']}]{selected_count} selected[/]"
+            title += f" {_ACCENT_TAG}{selected_count} selected[/]"
         title += "[/]"
 
-        return Panel(content, title=title, border_style=COLORS["border"])
+        return Panel(content, title=title, border_style=_BORDER)
 
 
 class PromptInput(Input):
@@ -200,79 +385,7 @@ class HawkTUI(App):
 
     TITLE = "HawkTUI"
 
-    CSS = """
-    Screen {
-        background: #1a1d23;
-    }
-
-    #main-container {
-        layout: horizontal;
-        height: 1fr;
-    }
-
-    #left-panel {
-        width: 25;
-        height: 100%;
-        padding: 1;
-    }
-
-    #center-panel {
-        width: 1fr;
-        height: 100%;
-        padding: 1;
-    }
-
-    #right-panel {
-        width: 28;
-        height: 100%;
-        padding: 1;
-    }
-
-    #prompt-input {
-        dock: bottom;
-        margin: 1;
-        background: #2d3748;
-        color: #e0e0e0;
-        border: solid #4a5f4a;
-    }
-
-    #prompt-input:focus {
-        border: solid #c9a227;
-    }
-
-    #status-bar {
-        height: 1;
-        dock: bottom;
-        padding: 0 1;
-        background: #2d3748;
-        text-style: bold;
-    }
-
-    #prompt-input.disabled {
-        background: #1a1d23;
-        color: #c9a227;
-    }
-
-    ProjectSelector {
-        height: auto;
-    }
-
-    ProjectSelector:focus {
-        border: solid #c9a227;
-    }
-
-    ImageList {
-        height: 1fr;
-    }
-
-    ImageList:focus {
-        border: solid #c9a227;
-    }
-
-    #help-panel {
-        height: auto;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -282,9 +395,9 @@ class HawkTUI(App):
         Binding("d", "delete_selected", "Delete"),
         Binding("l", "view_logs", "Logs"),
         Binding("p", "preview_image", "Preview"),
-        Binding("1", "select_project_1", "Wedding"),
-        Binding("2", "select_project_2", "Latin"),
-        Binding("3", "select_project_3", "DXP"),
+        Binding("1", "select_project('wedding-vision')", "Wedding"),
+        Binding("2", "select_project('latin-bible')", "Latin"),
+        Binding("3", "select_project('dxp-labs')", "DXP"),
         Binding("escape", "clear_or_focus_images", "Clear"),
         Binding("tab", "focus_next", "Next", priority=True),
         Binding("shift+tab", "focus_prev", "Prev", priority=True),
@@ -292,12 +405,21 @@ class HawkTUI(App):
 
     current_project = reactive("dxp-labs")
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # slug -> (images_dir mtime_ns, images) so project switches skip rescans
+        self._images_cache: dict[str, tuple[int, list[Path]]] = {}
+        self._delete_pool = ThreadPoolExecutor(max_workers=8)
+        self._last_project_slug: str | None = None
+        self._last_status: tuple[str, bool] | None = None
+        self._refresh_timer: Timer | None = None
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Container(
             Container(ProjectSelector(id="project-selector"), id="left-panel"),
             Container(ImageList(id="image-list"), id="center-panel"),
-            Container(Static(self._help_text(), id="help-panel"), id="right-panel"),
+            Container(Static(_HELP_TEXT, id="help-panel"), id="right-panel"),
             id="main-container",
         )
         yield PromptInput(
@@ -307,108 +429,117 @@ class HawkTUI(App):
         yield Static("Ready", id="status-bar")
         yield Footer()
 
-    def _help_text(self) -> str:
-        return f"""[bold]Navigation[/]
-[{COLORS['accent']}]↑/↓[/] Move cursor
-[{COLORS['accent']}]Tab[/] Switch panels
-[{COLORS['accent']}]Enter[/] Select/Open
-
-[bold]Images[/]
-[{COLORS['accent']}]Space[/] Toggle select
-[{COLORS['accent']}]a[/] Select all
-[{COLORS['accent']}]p[/] Preview (chafa)
-[{COLORS['accent']}]Esc[/] Clear selection
-
-[bold]Actions[/]
-[{COLORS['accent']}]v[/] Create video + captions
-[{COLORS['accent']}]b[/] Browse folder
-[{COLORS['accent']}]d[/] Delete selected
-[{COLORS['accent']}]l[/] View logs
-
-[bold]Projects[/]
-[{COLORS['accent']}]1[/] Wedding Vision
-[{COLORS['accent']}]2[/] Latin Bible
-[{COLORS['accent']}]3[/] DXP Labs
-
-[{COLORS['accent']}]q[/] Quit"""
-
     def on_mount(self) -> None:
         """Initialize the app."""
-        self.push_screen(SplashScreen())
-        selector = self.query_one("#project-selector", ProjectSelector)
-        selector.selected = self.current_project
-        self.refresh_images()
-        # Focus the prompt input by default for immediate generation
-        self.query_one("#prompt-input").focus()
+        # Cache widget references so hot paths skip DOM queries
+        self._status_bar = self.query_one("#status-bar", Static)
+        self._image_list = self.query_one("#image-list", ImageList)
+        self._prompt_input = self.query_one("#prompt-input", PromptInput)
+        self._project_selector = self.query_one("#project-selector", ProjectSelector)
+
+        # Focus the prompt input once the splash is gone, for immediate generation
+        self.push_screen(SplashScreen(), self._on_splash_dismissed)
+        self._project_selector.selected = self.current_project
+        # Scan the images folder after the first paint rather than before it
+        self.call_after_refresh(self.refresh_images)
+        # The reactive's initial watch call would otherwise rescan again
+        self._last_project_slug = self.current_project
+
+    def _on_splash_dismissed(self, _result: None = None) -> None:
+        """Give the prompt focus once the main UI is visible."""
+        self._prompt_input.focus()
 
     @property
     def project(self) -> Project:
         return PROJECTS[self.current_project]
 
-    @property
-    def image_list(self) -> ImageList:
-        return self.query_one("#image-list", ImageList)
-
     def refresh_images(self) -> None:
-        images = image_generator.get_project_images(self.project)
-        self.image_list.set_images(images)
+        project = self.project
+        project.ensure_dirs()
+        mtime = project.images_dir.stat().st_mtime_ns
+        cached = self._images_cache.get(project.slug)
+        if cached and cached[0] == mtime:
+            images = cached[1]
+        else:
+            images = image_generator.get_project_images(project)
+            self._images_cache[project.slug] = (mtime, images)
+        self._image_list.set_images(images)
         backend_status = image_generator.get_backend_status()
         self.set_status(f"{self.project.name}: {len(images)} images | {backend_status}")
 
     def watch_current_project(self, project_slug: str) -> None:
-        selector = self.query_one("#project-selector", ProjectSelector)
-        selector.selected = project_slug
+        if project_slug == self._last_project_slug:
+            return
+        self._last_project_slug = project_slug
+        if self._project_selector.selected != project_slug:
+            self._project_selector.selected = project_slug
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh images once project changes settle, coalescing key repeat."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(0.15, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        self._refresh_timer = None
         self.refresh_images()
 
+    def _flush_scheduled_refresh(self) -> None:
+        """Run a pending debounced refresh now instead of after the delay."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._run_scheduled_refresh()
+
     def set_status(self, message: str, working: bool = False) -> None:
-        status = self.query_one("#status-bar", Static)
+        # Re-sending the same text would still rebuild the Text and repaint
+        if self._last_status == (message, working):
+            return
+        self._last_status = (message, working)
         if working:
-            status.update(f"[bold {COLORS['accent']}]⏳ {message}[/]")
+            self._status_bar.update(Text(f"⏳ {message}", style=_STYLE_WORKING))
         else:
-            status.update(f"[{COLORS['success']}]✓[/] {message}")
+            self._status_bar.update(Text.assemble(("✓", _STYLE_OK), " ", message))
 
     # Focus management
     def action_focus_next(self) -> None:
         """Cycle focus: prompt -> projects -> images -> prompt."""
         focused = self.focused
         if isinstance(focused, PromptInput):
-            self.query_one("#project-selector").focus()
+            self._project_selector.focus()
         elif isinstance(focused, ProjectSelector):
-            self.query_one("#image-list").focus()
+            self._image_list.focus()
         else:
-            self.query_one("#prompt-input").focus()
+            self._prompt_input.focus()
 
     def action_focus_prev(self) -> None:
         """Cycle focus backwards."""
         focused = self.focused
         if isinstance(focused, PromptInput):
-            self.query_one("#image-list").focus()
+            self._image_list.focus()
         elif isinstance(focused, ProjectSelector):
-            self.query_one("#prompt-input").focus()
+            self._prompt_input.focus()
         else:
-            self.query_one("#project-selector").focus()
+            self._project_selector.focus()
 
     def action_focus_prompt(self) -> None:
         """Focus the prompt input."""
-        self.query_one("#prompt-input").focus()
+        self._prompt_input.focus()
 
     def action_clear_or_focus_images(self) -> None:
         """Clear selection or focus images panel."""
         if isinstance(self.focused, PromptInput):
-            self.query_one("#image-list").focus()
+            self._image_list.focus()
         else:
-            self.image_list.clear_selection()
+            self._image_list.clear_selection()
             self.set_status("Selection cleared")
 
     # Project selection
-    def action_select_project_1(self) -> None:
-        self.current_project = "wedding-vision"
-
-    def action_select_project_2(self) -> None:
-        self.current_project = "latin-bible"
-
-    def action_select_project_3(self) -> None:
-        self.current_project = "dxp-labs"
+    def action_select_project(self, slug: str) -> None:
+        if self.current_project != slug:
+            self.current_project = slug
+            # A direct jump can't key-repeat through projects, so skip the debounce
+            self._flush_scheduled_refresh()
 
     # Message handlers
     def on_project_selector_changed(self, event: ProjectSelector.Changed) -> None:
@@ -418,7 +549,10 @@ class HawkTUI(App):
     def on_project_selector_selected(self, event: ProjectSelector.Selected) -> None:
         """Handle project selection (Enter)."""
         self.current_project = event.value
-        self.query_one("#prompt-input").focus()
+        # Enter settles the project, so refresh now; the debounced refresh
+        # would otherwise overwrite the status below with the image count
+        self._flush_scheduled_refresh()
+        self._prompt_input.focus()
         self.set_status(f"Selected {self.project.name} - enter a prompt")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -431,19 +565,33 @@ class HawkTUI(App):
 
     def on_prompt_input_cancelled(self, event: PromptInput.Cancelled) -> None:
         """Handle Escape in prompt input."""
-        self.query_one("#image-list").focus()
+        self._image_list.focus()
         self.set_status("Cancelled")
 
-    @work(exclusive=True, thread=True)
-    def _do_generate(self, prompt: str) -> None:
-        """Generate images."""
-        self.call_from_thread(self._show_generating, prompt)
+    @work(exclusive=True, group="generate")
+    async def _do_generate(self, prompt: str) -> None:
+        """Generate images (blocking backend call runs in the default executor)."""
+        worker = get_current_worker()
+        self._show_generating(prompt)
+        last_ts = 0.0
+        last_state: tuple[int, str] | None = None
         
         def progress_update(step: int, total: int, status: str):
-            """Update status bar with generation progress."""
+            """Update status bar with generation progress (called off the event loop)."""
+            nonlocal last_ts, last_state
+            # The executor thread outlives a cancelled worker; keep its
+            # remaining steps out of the status bar
+            if worker.is_cancelled:
+                return
+            pct = int((step / total) * 100) if total > 0 else -1
+            now = time.monotonic()
+            # Cap per-step repaints at ~10 Hz; phase starts (step 0) and the
+            # final step always go through
+            if (pct, status) == last_state or (now - last_ts < 0.1 and 0 < step < total):
+                return
+            last_ts, last_state = now, (pct, status)
             if total > 0:
-                pct = int((step / total) * 100)
-                bar = "█" * (pct // 10) + "░" * (10 - pct // 10)
+                bar = _BARS[pct // 10]
                 self.call_from_thread(
                     self.set_status, 
                     f"⏳ [{bar}] {status}", 
@@ -454,27 +602,40 @@ class HawkTUI(App):
         
         try:
             logger.info(f"User requested generation: {prompt[:50]}...")
-            paths, metadata = image_generator.generate_image(
-                self.project, 
-                prompt,
-                progress_callback=progress_update,
+            paths, metadata = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(
+                    image_generator.generate_image,
+                    self.project,
+                    prompt,
+                    progress_callback=progress_update,
+                ),
             )
-            self.call_from_thread(self.refresh_images)
+            self._images_cache.pop(self.project.slug, None)
             # Show enhanced status if prompt was enhanced
             status_msg = f"Generated {len(paths)} image(s)"
             if metadata.get("enhanced"):
                 status_msg += " [enhanced]"
-            self.call_from_thread(self.set_status, status_msg)
-            self.call_from_thread(self._focus_images)
+            self._finish_generate(status_msg, True)
+        except asyncio.CancelledError:
+            self._hide_generating()
+            raise
         except Exception as e:
             import traceback
             error_msg = f"{type(e).__name__}: {str(e)}"
             logger.error(f"Generation failed: {error_msg}")
             logger.error(traceback.format_exc())
             # Show full error in status (truncated for display)
-            self.call_from_thread(self.set_status, f"Error: {error_msg[:80]}")
-        finally:
-            self.call_from_thread(self._hide_generating)
+            self._finish_generate(f"Error: {error_msg[:80]}", False)
+
+    def _finish_generate(self, status: str, succeeded: bool) -> None:
+        """Apply all end-of-generation UI updates together."""
+        if succeeded:
+            self.refresh_images()
+        self._hide_generating()
+        self.set_status(status)
+        if succeeded:
+            self._focus_images()
 
     def _show_generating(self, prompt: str) -> None:
         """Show generating state."""
@@ -482,39 +643,44 @@ class HawkTUI(App):
         enhancing = " (enhancing)" if USE_OLLAMA else ""
         self.set_status(f"⏳ [{backend}]{enhancing} Generating: {prompt[:25]}...", True)
         # Disable input while generating
-        prompt_input = self.query_one("#prompt-input", PromptInput)
-        prompt_input.placeholder = f"⏳ Generating via {backend}... please wait"
-        prompt_input.disabled = True
+        self._prompt_input.placeholder = f"⏳ Generating via {backend}... please wait"
+        self._prompt_input.disabled = True
 
     def _hide_generating(self) -> None:
         """Hide generating state."""
-        prompt_input = self.query_one("#prompt-input", PromptInput)
-        prompt_input.placeholder = "Enter prompt and press Enter to generate..."
-        prompt_input.disabled = False
+        self._prompt_input.placeholder = "Enter prompt and press Enter to generate..."
+        self._prompt_input.disabled = False
 
     def _focus_images(self) -> None:
         """Focus images after generation."""
-        self.query_one("#image-list").focus()
+        self._image_list.focus()
 
     def action_delete_selected(self) -> None:
         """Delete selected images."""
-        selected = self.image_list.selected_indices
-        images = self.image_list.images
+        # The list must belong to self.project before acting on its selection
+        self._flush_scheduled_refresh()
+        selected = self._image_list.selected_indices
+        images = self._image_list.images
         if not selected:
             self.set_status("No images selected (Space to select)")
             return
-        count = 0
-        for idx in sorted(selected, reverse=True):
-            if idx < len(images):
-                if image_generator.delete_image(images[idx]):
-                    count += 1
+        # selected is the cached ascending list, so walking it backwards
+        # gives highest-first order with no sort and no second bitmap scan
+        futures = [
+            self._delete_pool.submit(image_generator.delete_image, images[idx])
+            for idx in reversed(selected)
+            if idx < len(images)
+        ]
+        count = sum(1 for f in as_completed(futures) if f.result())
+        self._images_cache.pop(self.project.slug, None)
         self.refresh_images()
         self.set_status(f"Deleted {count} images")
 
     def action_create_video(self) -> None:
         """Create video from selected images - shows caption editor first."""
-        selected = self.image_list.selected_indices
-        images = self.image_list.images
+        self._flush_scheduled_refresh()
+        selected = self._image_list.get_sorted_selected()
+        images = self._image_list.images
         
         logger.info(f"Create video requested: {len(selected)} images selected")
 
@@ -523,9 +689,11 @@ class HawkTUI(App):
             return
 
         # Get selected image paths
-        selected_paths = [images[i] for i in sorted(selected)]
+        selected_paths = [images[i] for i in selected]
         
         # Show caption editor modal
+        from hawk.screens.captions import CaptionEditor
+
         def handle_captions(captions: list[str] | None) -> None:
             if captions is None:
                 # User cancelled
@@ -537,49 +705,90 @@ class HawkTUI(App):
         
         self.push_screen(CaptionEditor(selected_paths), handle_captions)
 
-    @work(exclusive=True, thread=True)
-    def _create_video_with_captions(self, selected_paths: list[Path], captions: list[str]) -> None:
-        """Actually create the video (runs in thread)."""
-        self.call_from_thread(self.set_status, f"Creating video from {len(selected_paths)} images...", True)
+    @work(exclusive=True, group="video")
+    async def _create_video_with_captions(self, selected_paths: list[Path], captions: list[str]) -> None:
+        """Actually create the video (FFmpeg runs in the default executor)."""
+        from hawk import video
+
+        self.set_status(f"Creating video from {len(selected_paths)} images...", True)
         try:
             logger.info(f"Creating slideshow: {[p.name for p in selected_paths]}")
             logger.info(f"Captions: {captions}")
             
             # Only pass captions if at least one is non-empty
             has_captions = any(c.strip() for c in captions) if captions else False
-            output = video.create_slideshow(
-                self.project,
-                selected_paths,
-                captions=captions if has_captions else None,
+            output = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(
+                    video.create_slideshow,
+                    self.project,
+                    selected_paths,
+                    captions=captions if has_captions else None,
+                ),
             )
             
             logger.info(f"Video saved: {output}")
-            self.call_from_thread(self.set_status, f"✅ Video saved: {output.name}")
+            self.set_status(f"✅ Video saved: {output.name}")
             
             # Open the exports folder
-            import subprocess
-            subprocess.run(["open", str(output.parent)])
+            spawn_detached(["open", str(output.parent)])
         except Exception as e:
             logger.error(f"Video creation failed: {e}")
-            self.call_from_thread(self.set_status, f"❌ Error: {str(e)[:60]}")
+            self.set_status(f"❌ Error: {str(e)[:60]}")
 
     def action_browse(self) -> None:
         """Open the project images folder."""
-        import subprocess
-        subprocess.run(["open", str(self.project.images_dir)])
+        # Fire and forget so the event loop isn't held while `open` runs
+        try:
+            spawn_detached(["open", str(self.project.images_dir)])
+        except FileNotFoundError:
+            self.set_status("Could not browse folder: 'open' command not found")
+            return
         self.set_status(f"Opened {self.project.images_dir}")
 
     def action_view_logs(self) -> None:
         """Open the log file in default editor."""
-        import subprocess
         from hawk.config import LOG_FILE
-        subprocess.run(["open", str(LOG_FILE)])
+        spawn_detached(["open", str(LOG_FILE)])
         self.set_status(f"Opened log: {LOG_FILE}")
 
+    @work(exclusive=True, group="preview")
+    async def _preview_with_chafa(self, image_path: Path) -> None:
+        """Capture chafa output off the event loop and show it in a screen."""
+        from hawk.screens.preview import CapturedPreviewScreen
+
+        # Leave room for the panel border and subtitle
+        width = max(20, self.size.width - 4)
+        height = max(10, self.size.height - 4)
+        self.set_status(f"Rendering {image_path.name}...", True)
+        result = await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                subprocess.run,
+                [
+                    "chafa",
+                    "--format", "symbols",
+                    "--colors", "full",
+                    "--size", f"{width}x{height}",
+                    "--animate", "off",
+                    str(image_path),
+                ],
+                capture_output=True,
+                text=True,
+            ),
+        )
+        if result.returncode != 0:
+            logger.error(f"chafa failed: {result.stderr.strip()}")
+            self.set_status(f"❌ Preview failed: {image_path.name}")
+            return
+        self.push_screen(CapturedPreviewScreen(image_path.name, result.stdout))
+        self.set_status(f"Previewed: {image_path.name}")
+
     def action_preview_image(self) -> None:
         """Preview current image in terminal using chafa (if installed) or Quick Look."""
-        images = self.image_list.images
-        cursor = self.image_list.cursor
+        self._flush_scheduled_refresh()
+        images = self._image_list.images
+        cursor = self._image_list.cursor
         
         if not images or cursor >= len(images):
             self.set_status("No image to preview")
@@ -587,29 +796,12 @@ class HawkTUI(App):
         
         image_path = images[cursor]
         
-        import subprocess
-        import shutil
-        
         # Check if chafa is available for in-terminal preview
         if shutil.which("chafa"):
-            # Suspend TUI, show image with chafa, resume
-            with self.suspend():
-                print(f"\n📷 {image_path.name}\n")
-                # Use chafa with auto-detect, fit to terminal width
-                subprocess.run([
-                    "chafa", 
-                    "--size", "80x40",
-                    "--animate", "off",
-                    str(image_path)
-                ])
-                print("\n[Press Enter to return to HawkTUI]")
-                input()
-            self.set_status(f"Previewed: {image_path.name}")
+            self._preview_with_chafa(image_path)
         else:
             # Fallback to Quick Look
-            subprocess.Popen(["qlmanage", "-p", str(image_path)], 
-                            stdout=subprocess.DEVNULL, 
-                            stderr=subprocess.DEVNULL)
+            spawn_detached(["qlmanage", "-p", str(image_path)])
             self.set_status(f"Quick Look: {image_path.name} (install chafa for in-terminal: brew install chafa)")
 
 
@@ -105,8 +105,12 @@ USE_LOCAL_IMAGE_GEN = os.getenv("USE_LOCAL_IMAGE_GEN", "false").lower() == "true
 #   stabilityai/sdxl-turbo - Fast, 8-15 steps, ~6GB RAM
 #   stabilityai/stable-diffusion-xl-base-1.0 - Standard, 20-30 steps, ~6GB RAM
 SD_MODEL = os.getenv("SD_MODEL", "stabilityai/sdxl-turbo")
-SD_INFERENCE_STEPS = int(os.getenv("SD_INFERENCE_STEPS", "15"))  # 4 for Flux, 8-15 for turbo, 20-30 for standard
+SD_INFERENCE_STEPS = int(os.getenv("SD_INFERENCE_STEPS", "15"))  # 4 for Flux, 8-15 for turbo, ~18 for standard (DPM-Solver++)
 SD_GUIDANCE_SCALE = float(os.getenv("SD_GUIDANCE_SCALE", "0.0"))  # 0.0 for Flux/turbo, 7.5 for standard
+SD_FORCE_FP16 = os.getenv("SD_FORCE_FP16", "false").lower() == "true"  # Keep float16 on CUDA (e.g. Pascal GPUs)
+SD_COMPILE = os.getenv("SD_COMPILE", "false").lower() == "true"  # torch.compile the UNet/transformer on CUDA
+SD_LOW_VRAM = os.getenv("SD_LOW_VRAM", "false").lower() == "true"  # Slice/tile VAE decode to cut peak memory
+SD_QUANT = os.getenv("SD_QUANT", "").lower()  # "int8" or "nf4": bitsandbytes-quantize the UNet/transformer (CUDA only)
 
 # Debug/verbose mode
 VERBOSE = os.getenv("VERBOSE", "false").lower() == "true"
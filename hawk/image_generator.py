@@ -4,6 +4,7 @@ Routes to either Replicate API or local Diffusers based on configuration.
 Optionally enhances prompts using Ollama when enabled.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -39,8 +40,15 @@ def get_backend_info() -> dict:
     return info
 
 
+@lru_cache(maxsize=1)
 def get_backend_status() -> str:
-    """Get a short status string for display in TUI."""
+    """
+    Get a short status string for display in TUI.
+
+    Backends are fixed by config at import, so the result (including the
+    Ollama reachability probe) is computed once. Call
+    ``get_backend_status.cache_clear()`` to force a re-check.
+    """
     parts = []
     
     if USE_LOCAL_IMAGE_GEN:
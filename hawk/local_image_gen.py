@@ -1,27 +1,82 @@
 """Local image generation using Hugging Face Diffusers."""
 
+import base64
+import gc
+import itertools
 import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Callable
 
+from PIL import Image
+
 # Fix macOS multiprocessing issue with diffusers
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 os.environ["OMP_NUM_THREADS"] = "1"
 
-from hawk.config import Project, SD_MODEL, TIKTOK_WIDTH, TIKTOK_HEIGHT, SD_INFERENCE_STEPS, SD_GUIDANCE_SCALE
+from hawk.config import (
+    Project,
+    SD_MODEL,
+    TIKTOK_WIDTH,
+    TIKTOK_HEIGHT,
+    SD_INFERENCE_STEPS,
+    SD_GUIDANCE_SCALE,
+    SD_FORCE_FP16,
+    SD_COMPILE,
+    SD_LOW_VRAM,
+    SD_QUANT,
+)
 from hawk import logger
 
+# torch is optional; diffusers stays lazy in preload_model since it is the
+# expensive import and only needed to build a pipeline
+try:
+    import torch
+except ImportError:
+    torch = None
+
 # Lazy load heavy imports
 _pipeline = None
 _current_model = None
 _model_loaded = False
+_offload_mode = None  # "model" when CPU offload hooks are installed
+# Pipeline parked in CPU RAM by unload_model(), so a reload skips from_pretrained
+_parked_pipeline = None
+_parked_model = None
+# Set once any preload_model call has run, whether or not it succeeded
+_preload_attempted = False
+# Reused pinned host buffer for decoded batches (see _tensors_to_pil)
+_pinned_host = None
+
+# Truncate prompts to fit CLIP's 77 token limit (~250 chars)
+MAX_PROMPT_CHARS = 250
+# Anything outside letters, digits, space, '-' and '_' is dropped from filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Serializes loads so a splash-screen warmup and a first generation
+# can't both run from_pretrained
+_load_lock = threading.Lock()
+
+# Pinned staging memory _upload_to_cuda holds before waiting on its copies
+_PIN_BUDGET_BYTES = 256 * 1024 * 1024
+
+# PNG encoding releases the GIL in zlib, so batch outputs are written in parallel
+_io_pool = ThreadPoolExecutor(max_workers=2)
 
 
 def is_model_cached(model_name: Optional[str] = None) -> bool:
     """Check if the model is already downloaded to HuggingFace cache."""
-    model_name = model_name or SD_MODEL
-    
+    return _is_model_cached(model_name or SD_MODEL)
+
+
+@lru_cache(maxsize=32)
+def _is_model_cached(model_name: str) -> bool:
+    """Cached HF cache lookup; cleared by preload_model after a download."""
     try:
         from huggingface_hub import try_to_load_from_cache, model_info
         
@@ -51,6 +106,32 @@ def get_model_size(model_name: Optional[str] = None) -> str:
     return sizes.get(model_name, "~4-7 GB")
 
 
+def _model_size_bytes(model_name: Optional[str] = None) -> float:
+    """Upper bound of get_model_size() in bytes, for VRAM fit checks."""
+    upper = get_model_size(model_name).strip("~ GB").split("-")[-1]
+    return float(upper) * 1024**3
+
+
+def _quantization_config(dtype):
+    """bitsandbytes config for SD_QUANT, applied to the UNet/transformer only."""
+    from diffusers.quantizers import PipelineQuantizationConfig
+    
+    if SD_QUANT == "nf4":
+        backend = "bitsandbytes_4bit"
+        kwargs = {"load_in_4bit": True, "bnb_4bit_quant_type": "nf4", "bnb_4bit_compute_dtype": dtype}
+    elif SD_QUANT == "int8":
+        backend = "bitsandbytes_8bit"
+        kwargs = {"load_in_8bit": True}
+    else:
+        raise ValueError(f"Unsupported SD_QUANT={SD_QUANT!r} (use int8 or nf4)")
+    # Components missing from a pipeline are skipped, so list both denoisers
+    return PipelineQuantizationConfig(
+        quant_backend=backend,
+        quant_kwargs=kwargs,
+        components_to_quantize=["transformer", "unet"],
+    )
+
+
 def preload_model(
     model_name: Optional[str] = None,
     progress_callback: Optional[Callable[[str], None]] = None,
@@ -65,7 +146,20 @@ def preload_model(
     Returns:
         True if successful, False otherwise
     """
-    global _pipeline, _current_model, _model_loaded
+    global _preload_attempted
+    
+    with _load_lock:
+        _preload_attempted = True
+        return _preload_model(model_name, progress_callback)
+
+
+def _preload_model(
+    model_name: Optional[str],
+    progress_callback: Optional[Callable[[str], None]],
+) -> bool:
+    """preload_model body; caller holds _load_lock."""
+    global _pipeline, _current_model, _model_loaded, _offload_mode
+    global _parked_pipeline, _parked_model
     
     model_name = model_name or SD_MODEL
     
@@ -80,16 +174,20 @@ def preload_model(
             update("Model already loaded")
             return True
         
+        parked = _parked_pipeline is not None and _parked_model == model_name
+        
         # Check if model is cached
-        cached = is_model_cached(model_name)
-        if cached:
+        cached = not parked and is_model_cached(model_name)
+        if parked:
+            update(f"Restoring {model_name} from RAM...")
+        elif cached:
             update(f"Loading {model_name} from cache...")
         else:
             update(f"Downloading {model_name} ({get_model_size(model_name)})...")
             update("This may take several minutes on first run...")
         
-        # Import and load
-        import torch
+        if torch is None:
+            raise ImportError("torch is not installed")
         
         # Fix macOS multiprocessing issue (fds_to_keep error)
         import multiprocessing
@@ -106,8 +204,11 @@ def preload_model(
         
         if torch.cuda.is_available():
             device = "cuda"
-            dtype = torch.bfloat16 if is_flux else torch.float16
-            update("Using CUDA GPU")
+            # bfloat16 runs at fp16 tensor-core rate on Ampere+ without fp16's
+            # overflow issues; SD_FORCE_FP16 keeps float16 for non-Flux models
+            use_bf16 = is_flux or (not SD_FORCE_FP16 and torch.cuda.is_bf16_supported())
+            dtype = torch.bfloat16 if use_bf16 else torch.float16
+            update(f"Using CUDA GPU with {'bfloat16' if use_bf16 else 'float16'}")
         elif torch.backends.mps.is_available():
             device = "mps"
             # MPS + Flux requires bfloat16; other models use float16
@@ -118,21 +219,98 @@ def preload_model(
             dtype = torch.float32
             update("Using CPU (slow)")
         
-        update("Loading model weights...")
-        _pipeline = AutoPipelineForText2Image.from_pretrained(
-            model_name,
-            torch_dtype=dtype,
-            use_safetensors=True,
-        )
-        
-        update(f"Moving model to {device}...")
-        _pipeline = _pipeline.to(device)
-        _current_model = model_name
-        _model_loaded = True
+        if parked:
+            _pipeline = _parked_pipeline
+        else:
+            update("Loading model weights...")
+            load_kwargs = {}
+            if SD_QUANT and device == "cuda":
+                load_kwargs["quantization_config"] = _quantization_config(dtype)
+                update(f"Quantizing denoiser to {SD_QUANT}")
+            # A warm start resolves every file from the local HF cache
+            # instead of sending a Hub request per config/weight file.
+            # low_cpu_mem_usage builds modules on the meta device and fills
+            # them from the mmapped safetensors, so there is no second
+            # randomly initialized copy of every weight in RAM
+            load = partial(
+                AutoPipelineForText2Image.from_pretrained,
+                model_name,
+                torch_dtype=dtype,
+                use_safetensors=True,
+                low_cpu_mem_usage=True,
+                **load_kwargs,
+            )
+            try:
+                _pipeline = load(local_files_only=cached)
+            except OSError:
+                if not cached:
+                    raise
+                # model_index.json is cached but shards are missing (e.g. an
+                # interrupted first download); let the Hub resume it
+                update(f"Cache incomplete, resuming download of {model_name}...")
+                cached = False
+                _pipeline = load(local_files_only=False)
+            if not cached:
+                # The weights are on disk now
+                _is_model_cached.cache_clear()
+            if _wants_dpm_solver(model_name, _pipeline.scheduler):
+                from diffusers import DPMSolverMultistepScheduler
+                
+                # DPM-Solver++ 2M with Karras sigmas reaches PNDM/Euler
+                # quality in ~18 steps instead of 25-50
+                _pipeline.scheduler = DPMSolverMultistepScheduler.from_config(
+                    _pipeline.scheduler.config,
+                    algorithm_type="dpmsolver++",
+                    use_karras_sigmas=True,
+                )
+                update("Using DPM-Solver++ Karras scheduler")
+        # Either way the parked copy is now live or stale
+        _parked_pipeline = None
+        _parked_model = None
         
-        # Enable memory optimizations
+        # Keep the whole pipeline resident on the GPU when it fits; model
+        # offload moves weights over PCIe on every step, so only use it
+        # when free VRAM is short
+        offload = False
         if device == "cuda":
+            free_bytes, _total = torch.cuda.mem_get_info()
+            offload = free_bytes < 1.2 * _model_size_bytes(model_name)
+        
+        if offload:
+            update("Not enough free VRAM, enabling CPU offload...")
             _pipeline.enable_model_cpu_offload()
+            _offload_mode = "model"
+        else:
+            update(f"Moving model to {device}...")
+            if device == "cuda" and not SD_QUANT:
+                _upload_to_cuda(_pipeline)
+            else:
+                _pipeline = _pipeline.to(device)
+            _offload_mode = None
+        
+        # Decode the VAE one image / one tile at a time: same compute, much
+        # smaller activation peak at 768x1344. Also used whenever offload is
+        # needed, since that already means memory is tight
+        if SD_LOW_VRAM or offload:
+            vae = getattr(_pipeline, "vae", None)
+            if vae is not None:
+                vae.enable_slicing()
+                vae.enable_tiling()
+            if device == "mps" and hasattr(_pipeline, "enable_attention_slicing"):
+                _pipeline.enable_attention_slicing("auto")
+        
+        # Compile the denoiser once; the first generation pays the warmup and
+        # later ones replay CUDA graphs. A parked pipeline is already compiled
+        if SD_COMPILE and device == "cuda" and not offload and not parked and not SD_QUANT:
+            denoiser = "transformer" if hasattr(_pipeline, "transformer") else "unet"
+            update(f"Compiling {denoiser} (first image will be slow)...")
+            setattr(
+                _pipeline,
+                denoiser,
+                torch.compile(getattr(_pipeline, denoiser), mode="reduce-overhead", fullgraph=True),
+            )
+        _current_model = model_name
+        _model_loaded = True
         
         update("Model ready!")
         return True
@@ -144,11 +322,63 @@ def preload_model(
         return False
 
 
+def _wants_dpm_solver(model_name: str, scheduler) -> bool:
+    """
+    Whether to swap in DPM-Solver++ for this model's default scheduler.
+    
+    Flux (flow matching), LCM and the distilled turbo models ship schedulers
+    tuned for 1-8 steps, so they keep their own.
+    """
+    name = model_name.lower()
+    if any(tag in name for tag in ("flux", "lcm", "turbo")):
+        return False
+    return type(scheduler).__name__ not in (
+        "FlowMatchEulerDiscreteScheduler",
+        "LCMScheduler",
+        "DPMSolverMultistepScheduler",
+    )
+
+
+def _upload_to_cuda(pipeline) -> None:
+    """
+    Move every pipeline component to CUDA through pinned staging buffers.
+    
+    Copies are queued non_blocking on a side stream, so pinning the next
+    tensor on the CPU overlaps with the DMA of the previous one. Staged
+    buffers are released every _PIN_BUDGET_BYTES, so page-locked memory
+    stays bounded instead of growing to the size of the model.
+    """
+    stream = torch.cuda.Stream()
+    staged = []  # pinned sources must outlive their async copies
+    staged_bytes = 0
+    with torch.cuda.stream(stream):
+        for component in pipeline.components.values():
+            if not isinstance(component, torch.nn.Module):
+                continue
+            for tensor in itertools.chain(component.parameters(), component.buffers()):
+                if tensor.device.type != "cpu":
+                    continue
+                pinned = tensor.data.pin_memory()
+                staged.append(pinned)
+                staged_bytes += pinned.nbytes
+                tensor.data = pinned.to("cuda", non_blocking=True)
+                if staged_bytes >= _PIN_BUDGET_BYTES:
+                    stream.synchronize()
+                    staged.clear()
+                    staged_bytes = 0
+    stream.synchronize()
+
+
 def is_model_loaded() -> bool:
     """Check if a model is currently loaded in memory."""
     return _model_loaded and _pipeline is not None
 
 
+def preload_attempted() -> bool:
+    """Check if preload_model has already run (e.g. from main before the TUI)."""
+    return _preload_attempted
+
+
 def _get_pipeline(model_name: Optional[str] = None):
     """Get or create the diffusion pipeline (lazy loaded)."""
     global _pipeline, _current_model, _model_loaded
@@ -169,25 +399,19 @@ def _get_pipeline(model_name: Optional[str] = None):
 
 def is_available() -> bool:
     """Check if local image generation is available (torch installed)."""
-    try:
-        import torch
-        return True
-    except ImportError:
-        return False
+    return torch is not None
 
 
 def get_device_info() -> dict:
     """Get information about available compute devices."""
-    try:
-        import torch
-        return {
-            "cuda": torch.cuda.is_available(),
-            "cuda_device": torch.cuda.get_device_name(0) if torch.cuda.is_available() else None,
-            "mps": torch.backends.mps.is_available(),
-            "cpu": True,
-        }
-    except ImportError:
+    if torch is None:
         return {"cuda": False, "mps": False, "cpu": True}
+    return {
+        "cuda": torch.cuda.is_available(),
+        "cuda_device": torch.cuda.get_device_name(0) if torch.cuda.is_available() else None,
+        "mps": torch.backends.mps.is_available(),
+        "cpu": True,
+    }
 
 
 def list_available_models() -> list[str]:
@@ -250,8 +474,7 @@ def generate_image(
     
     logger.info(f"Generation settings: steps={num_inference_steps}, guidance={guidance_scale}")
     
-    # Truncate prompt to fit CLIP's 77 token limit (~250 chars)
-    MAX_PROMPT_CHARS = 250
+    # Truncate prompt to fit CLIP's 77 token limit
     if len(prompt) > MAX_PROMPT_CHARS:
         truncated = prompt[:MAX_PROMPT_CHARS]
         last_break = max(truncated.rfind(","), truncated.rfind(" "))
@@ -261,94 +484,176 @@ def generate_image(
             prompt = truncated.strip()
         logger.warning(f"Prompt truncated to {len(prompt)} chars (CLIP 77 token limit)")
     
-    import torch
-    
     project.ensure_dirs()
     
     pipeline = _get_pipeline(model)
     width, height = _aspect_to_dimensions(aspect_ratio)
     
-    # Set up generator for reproducibility
+    # Set up generators for reproducibility, one per image in the batch
     device = pipeline.device
     generator = None
     if seed is not None:
-        generator = torch.Generator(device=device).manual_seed(seed)
+        generator = [torch.Generator(device=device).manual_seed(seed + i) for i in range(num_outputs)]
     
     saved_paths = []
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Create step callback for progress updates
-    # Note: Different pipelines use different callback signatures
-    def step_callback(pipe, step, timestep, callback_kwargs):
-        if progress_callback:
-            progress_callback(step + 1, num_inference_steps, f"Step {step + 1}/{num_inference_steps}")
-        return callback_kwargs
+    if progress_callback:
+        label = "image" if num_outputs == 1 else f"{num_outputs} images"
+        progress_callback(0, num_inference_steps, f"Generating {label}...")
     
-    for i in range(num_outputs):
-        if progress_callback:
-            progress_callback(0, num_inference_steps, f"Generating image {i + 1}/{num_outputs}...")
-        
-        # Build pipeline kwargs - not all pipelines support all params
-        pipe_kwargs = {
-            "prompt": prompt,
-            "width": width,
-            "height": height,
-            "num_inference_steps": num_inference_steps,
-            "generator": generator,
-        }
-        
-        # Only add guidance_scale if > 0 (Flux doesn't use it)
-        if guidance_scale > 0:
-            pipe_kwargs["guidance_scale"] = guidance_scale
-        
-        # Try to add callback - not all pipelines support it
-        try:
-            pipe_kwargs["callback_on_step_end"] = step_callback
-            result = pipeline(**pipe_kwargs)
-        except TypeError:
-            # Fallback without callback if not supported
-            del pipe_kwargs["callback_on_step_end"]
-            if progress_callback:
-                progress_callback(1, num_inference_steps, f"Generating... (no step progress for this model)")
-            result = pipeline(**pipe_kwargs)
-        
-        image = result.images[0]
-        
-        # Resize to exact TikTok dimensions if needed
-        if aspect_ratio == "9:16" and (image.width != TIKTOK_WIDTH or image.height != TIKTOK_HEIGHT):
-            from PIL import Image
-            image = image.resize((TIKTOK_WIDTH, TIKTOK_HEIGHT), Image.LANCZOS)
-        
+    # Build pipeline kwargs - not all pipelines support all params.
+    # All outputs go through one batched call: the prompt is encoded once
+    # and each denoising step runs over the whole batch
+    pipe_kwargs = {
+        "prompt": prompt,
+        "width": width,
+        "height": height,
+        "num_inference_steps": num_inference_steps,
+        "num_images_per_prompt": num_outputs,
+        "generator": generator,
+        # Keep the decoded batch as a tensor so resizing happens on-device
+        "output_type": "pt",
+    }
+    
+    # Only add guidance_scale if > 0 (Flux doesn't use it)
+    if guidance_scale > 0:
+        pipe_kwargs["guidance_scale"] = guidance_scale
+    
+    # Progress comes from polling the scheduler on a side thread rather than
+    # a per-step Python callback inside the denoising loop
+    done = threading.Event()
+    poller = None
+    if progress_callback:
+        if hasattr(pipeline.scheduler, "step_index"):
+            poller = threading.Thread(
+                target=_poll_progress,
+                args=(pipeline, progress_callback, num_inference_steps, done),
+                daemon=True,
+            )
+            poller.start()
+        else:
+            progress_callback(1, num_inference_steps, f"Generating... (no step progress for this model)")
+    try:
+        result = pipeline(**pipe_kwargs)
+    finally:
+        done.set()
+    if poller is not None:
+        poller.join()
+        progress_callback(num_inference_steps, num_inference_steps, f"Step {num_inference_steps}/{num_inference_steps}")
+    
+    # Same filename stem for every output of this prompt
+    safe_prompt = _UNSAFE_FILENAME_CHARS.sub("", prompt[:30]).strip().replace(" ", "_")
+    
+    images = _tensors_to_pil(result.images, fit_tiktok=aspect_ratio == "9:16")
+    
+    futures = []
+    for i, image in enumerate(images):
         # Save image
-        safe_prompt = "".join(c if c.isalnum() or c in " -_" else "" for c in prompt[:30])
-        safe_prompt = safe_prompt.strip().replace(" ", "_")
         filename = f"{timestamp}_{safe_prompt}_{i+1}.png"
         filepath = project.images_dir / filename
         
-        image.save(filepath, "PNG")
+        futures.append(_io_pool.submit(_write_png, image, filepath))
         saved_paths.append(filepath)
     
+    # Surface any write error before reporting the paths as saved
+    for future in futures:
+        future.result()
+    
     return saved_paths
 
 
-def unload_model():
-    """Unload the model from memory to free up VRAM/RAM."""
-    global _pipeline, _current_model
+def _poll_progress(
+    pipeline,
+    progress_callback: Callable[[int, int, str], None],
+    total_steps: int,
+    done: threading.Event,
+) -> None:
+    """Report the scheduler's completed step count every 100ms until done."""
+    last = 0
+    while not done.wait(0.1):
+        # step_index counts completed steps; None until denoising starts
+        step = pipeline.scheduler.step_index
+        if step and step != last and step < total_steps:
+            last = step
+            progress_callback(step, total_steps, f"Step {step}/{total_steps}")
+
+
+def _tensors_to_pil(images, fit_tiktok: bool) -> list:
+    """Resize a decoded [B, 3, H, W] batch in [0, 1] (on CUDA or CPU), then convert to PIL."""
+    global _pinned_host
+    
+    # bf16 can't represent every 0-255 step, so scale in float32
+    images = images.float()
+    # Antialiased bicubic on the GPU stands in for CPU Lanczos
+    if fit_tiktok and tuple(images.shape[-2:]) != (TIKTOK_HEIGHT, TIKTOK_WIDTH):
+        if images.device.type not in ("cuda", "cpu"):
+            # MPS lacks the antialiased bicubic kernel on many torch
+            # versions; the batch is headed to the CPU anyway
+            images = images.cpu()
+        images = torch.nn.functional.interpolate(
+            images,
+            size=(TIKTOK_HEIGHT, TIKTOK_WIDTH),
+            mode="bicubic",
+            antialias=True,
+        )
+    batch = images.mul(255).round_().clamp_(0, 255).to(torch.uint8).permute(0, 2, 3, 1).contiguous()
+    if batch.is_cuda:
+        # DMA into a reused pinned buffer instead of a fresh pageable copy
+        if _pinned_host is None or _pinned_host.shape != batch.shape:
+            _pinned_host = torch.empty(batch.shape, dtype=torch.uint8, pin_memory=True)
+        _pinned_host.copy_(batch, non_blocking=True)
+        torch.cuda.current_stream().synchronize()
+        host = _pinned_host
+    else:
+        host = batch.cpu()
+    # PIL copies each HWC slice (RGB has no zero-copy raw mode), so the
+    # pinned buffer is free to be reused by the next batch
+    return [Image.fromarray(array) for array in host.numpy()]
+
+
+def _write_png(image, filepath: Path) -> None:
+    """Save one output; runs on the I/O pool."""
+    # Level 1 is several times cheaper than the default 6 for a modestly larger file
+    image.save(filepath, "PNG", compress_level=1)
+
+
+def unload_model(keep_in_ram: bool = True):
+    """
+    Unload the model to free up VRAM (and RAM unless keep_in_ram).
+    
+    With keep_in_ram (the default) the weights are moved to CPU memory and
+    kept, so the next load of the same model is a device copy instead of
+    from_pretrained. That parked copy holds the full model in RAM (~23 GB
+    for FLUX) until unload_model(keep_in_ram=False) is called.
+    
+    Quantized pipelines (SD_QUANT) are never parked: bitsandbytes 8-bit
+    modules refuse .to("cpu") and would stay on the GPU.
+    """
+    global _pipeline, _current_model, _model_loaded, _offload_mode
+    global _parked_pipeline, _parked_model
+    keep_in_ram = keep_in_ram and not SD_QUANT
+    if not keep_in_ram:
+        _parked_pipeline = None
+        _parked_model = None
     if _pipeline is not None:
+        # Offload hooks hold references to the submodules; drop them first
+        if _offload_mode is not None:
+            _pipeline.remove_all_hooks()
+            _offload_mode = None
+        if keep_in_ram:
+            _parked_pipeline = _pipeline.to("cpu")
+            _parked_model = _current_model
         del _pipeline
         _pipeline = None
         _current_model = None
+        _model_loaded = False
         
         # Force garbage collection
-        import gc
         gc.collect()
         
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except ImportError:
-            pass
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
 
 def imgcat(image_path: Path, width: int = 40) -> str:
@@ -362,8 +667,6 @@ def imgcat(image_path: Path, width: int = 40) -> str:
     Returns:
         Escape sequence string to display the image
     """
-    import base64
-    
     with open(image_path, "rb") as f:
         image_data = f.read()
     
@@ -376,6 +679,15 @@ def imgcat(image_path: Path, width: int = 40) -> str:
 
 def print_image(image_path: Path, width: int = 40) -> None:
     """Print an image to the terminal using iTerm2 imgcat protocol."""
-    import sys
-    print(imgcat(image_path, width), file=sys.stdout, flush=True)
+    # Stream the file through base64 in chunks rather than building the whole
+    # escape sequence; a multiple of 3 bytes keeps padding off mid-stream
+    chunk_size = 57 * 1024
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    out.write(f"\033]1337;File=inline=1;width={width}:".encode("ascii"))
+    with open(image_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            out.write(base64.b64encode(chunk))
+    out.write(b"\007\n")
+    out.flush()
 
@@ -2,7 +2,9 @@
 
 import logging
 import sys
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -10,7 +12,7 @@ from hawk.config import VERBOSE, LOG_FILE
 
 # Create logger
 _logger: Optional[logging.Logger] = None
-_log_messages: list[str] = []  # In-memory log for TUI display
+_log_messages: deque[str] = deque(maxlen=100)  # In-memory log for TUI display (last 100)
 
 
 def get_logger() -> logging.Logger:
@@ -53,11 +55,8 @@ def log(message: str, level: str = "info") -> None:
     log_func = getattr(logger, level.lower(), logger.info)
     log_func(message)
     
-    # Store in memory for TUI
+    # Store in memory for TUI; the deque drops the oldest past 100
     _log_messages.append(f"[{timestamp}] {message}")
-    # Keep only last 100 messages
-    if len(_log_messages) > 100:
-        _log_messages.pop(0)
 
 
 def debug(message: str) -> None:
@@ -82,7 +81,8 @@ def error(message: str) -> None:
 
 def get_recent_logs(count: int = 20) -> list[str]:
     """Get recent log messages for TUI display."""
-    return _log_messages[-count:]
+    size = len(_log_messages)
+    return list(islice(_log_messages, max(0, size - count), size))
 
 
 def clear_logs() -> None:
@@ -0,0 +1,14 @@
+"""Helpers for launching external programs from Hawk TUI."""
+
+import subprocess
+
+
+def spawn_detached(args: list[str]) -> None:
+    """Launch a helper like `open` fully detached; returns without waiting."""
+    subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
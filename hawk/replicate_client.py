@@ -1,8 +1,6 @@
 """Replicate API client for image generation."""
 
 import os
-import httpx
-import replicate
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -16,6 +14,8 @@ if os.getenv('REPLICATE_API_TOKEN'):
 
 from hawk.config import Project, REPLICATE_DEFAULT_PARAMS
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
 # Cache for model versions
 _model_versions: dict[str, str] = {}
 
@@ -23,6 +23,7 @@ _model_versions: dict[str, str] = {}
 def _get_model_version(model_name: str) -> str:
     """Get the latest version for a model, caching the result."""
     if model_name not in _model_versions:
+        import replicate
         model = replicate.models.get(model_name)
         _model_versions[model_name] = f"{model_name}:{model.latest_version.id}"
     return _model_versions[model_name]
@@ -40,6 +41,10 @@ def generate_image(
 
     Returns list of saved image paths.
     """
+    # The SDK and HTTP client are only needed once a generation runs
+    import httpx
+    import replicate
+
     project.ensure_dirs()
 
     # Build the prompt with trigger word if needed
@@ -104,12 +109,15 @@ def generate_batch(
 def get_project_images(project: Project) -> list[Path]:
     """Get all images in a project's images folder."""
     project.ensure_dirs()
-    extensions = {".png", ".jpg", ".jpeg", ".webp"}
-    images = [
-        f for f in project.images_dir.iterdir()
-        if f.suffix.lower() in extensions
-    ]
-    return sorted(images, key=lambda x: x.stat().st_mtime, reverse=True)
+    # One scandir pass: filter on the entry name and reuse the entry's stat,
+    # building a Path only for the images that are kept
+    with os.scandir(project.images_dir) as entries:
+        found = [
+            (entry.stat().st_mtime, entry.path) for entry in entries
+            if entry.name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+    found.sort(key=lambda item: item[0], reverse=True)
+    return [Path(path) for _, path in found]
 
 
 def delete_image(image_path: Path) -> bool:
@@ -1,5 +1,5 @@
 """Hawk TUI screens."""
 from hawk.screens.splash import SplashScreen
-from hawk.screens.preview import ImagePreviewScreen
+from hawk.screens.preview import ImagePreviewScreen, CapturedPreviewScreen
 
-__all__ = ["SplashScreen", "ImagePreviewScreen"]
+__all__ = ["SplashScreen", "ImagePreviewScreen", "CapturedPreviewScreen"]
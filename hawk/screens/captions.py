@@ -98,6 +98,7 @@ class CaptionEditor(ModalScreen[list[str] | None]):
         self.images = images
         self.captions: list[str] = [""] * len(images)
         self._current_input = 0
+        self._inputs: list[Input] = []
 
     def compose(self) -> ComposeResult:
         with Container(id="caption-dialog"):
@@ -121,19 +122,18 @@ class CaptionEditor(ModalScreen[list[str] | None]):
 
     def on_mount(self) -> None:
         """Focus first input on mount."""
+        # One DOM walk; inputs come back in compose order, i.e. by image index
+        self._inputs = list(self.query(".caption-input").results(Input))
         self._focus_input(0)
 
     def _focus_input(self, index: int) -> None:
         """Focus a specific input by index."""
-        if 0 <= index < len(self.images):
-            try:
-                input_widget = self.query_one(f"#caption-{index}", Input)
-                input_widget.focus()
-                self._current_input = index
-                # Scroll to make sure it's visible
-                input_widget.scroll_visible()
-            except Exception:
-                pass
+        if 0 <= index < len(self._inputs):
+            input_widget = self._inputs[index]
+            input_widget.focus()
+            self._current_input = index
+            # Scroll to make sure it's visible
+            input_widget.scroll_visible()
 
     def action_focus_next_input(self) -> None:
         """Focus next caption input."""
@@ -165,12 +165,8 @@ class CaptionEditor(ModalScreen[list[str] | None]):
 
     def _collect_captions(self) -> None:
         """Collect all caption values from inputs."""
-        for i in range(len(self.images)):
-            try:
-                input_widget = self.query_one(f"#caption-{i}", Input)
-                self.captions[i] = input_widget.value.strip()
-            except Exception:
-                self.captions[i] = ""
+        for i, input_widget in enumerate(self._inputs):
+            self.captions[i] = input_widget.value.strip()
 
     def action_cancel(self) -> None:
         self.dismiss(None)
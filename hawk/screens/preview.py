@@ -9,9 +9,10 @@ from pathlib import Path
 from rich.panel import Panel
 from rich.text import Text
 from PIL import Image
-import subprocess
 import io
 
+from hawk.process import spawn_detached
+
 
 def image_to_ascii(image_path: Path, width: int = 80, height: int = 40) -> str:
     """Convert image to ASCII art using block characters."""
@@ -117,11 +118,12 @@ class ImagePreviewScreen(Screen):
 
     def on_mount(self) -> None:
         """Open full resolution image in system viewer when preview opens."""
+        self._preview = self.query_one("#preview", ImagePreview)
         self._open_in_preview()
 
     def _open_in_preview(self) -> None:
         """Open current image in macOS Preview."""
-        subprocess.Popen(["open", str(self.image_path)])
+        spawn_detached(["open", str(self.image_path)])
 
     def key_escape(self) -> None:
         """Handle escape key to close preview."""
@@ -154,8 +156,49 @@ class ImagePreviewScreen(Screen):
     def _update_image(self) -> None:
         """Update the displayed image."""
         self.image_path = self.all_images[self.current_index]
-        preview = self.query_one("#preview", ImagePreview)
-        preview.image_path = self.image_path
-        preview.refresh()
+        self._preview.image_path = self.image_path
+        self._preview.refresh()
         # Also open the new image in Preview
         self._open_in_preview()
+
+
+class CapturedPreviewScreen(Screen):
+    """Full screen preview of pre-rendered ANSI output (e.g. from chafa)."""
+
+    CSS = """
+    CapturedPreviewScreen {
+        background: #1a1d23;
+        align: center middle;
+    }
+
+    #captured-preview {
+        width: auto;
+        height: auto;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close", priority=True),
+        Binding("enter", "close", "Close", priority=True),
+        Binding("q", "close", "Close"),
+    ]
+
+    def __init__(self, title: str, ansi: str, **kwargs):
+        super().__init__(**kwargs)
+        self.title_text = title
+        self.ansi = ansi
+
+    def compose(self) -> ComposeResult:
+        yield Static(
+            Panel(
+                Text.from_ansi(self.ansi),
+                title=f"[bold]{self.title_text}[/]",
+                subtitle="[dim]Esc/Enter/q=close[/]",
+                border_style="#c9a227",
+            ),
+            id="captured-preview",
+        )
+
+    def action_close(self) -> None:
+        """Close the preview and return to main app."""
+        self.app.pop_screen()
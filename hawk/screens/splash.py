@@ -1,10 +1,14 @@
 """Splash screen for HawkTUI."""
 
+import threading
+
 from textual.screen import Screen
 from textual.widgets import Static
 from textual.app import ComposeResult
 from textual.containers import Center, Middle
 
+from hawk.config import USE_LOCAL_IMAGE_GEN
+
 SPLASH_CONTENT = """[bold #c9a227]
 ██╗  ██╗ █████╗ ██╗    ██╗██╗  ██╗████████╗██╗   ██╗██╗
 ██║  ██║██╔══██╗██║    ██║██║ ██╔╝╚══██╔══╝██║   ██║██║
@@ -44,6 +48,16 @@ SPLASH_CONTENT = """[bold #c9a227]
 """
 
 
+def _warm_local_model() -> None:
+    """Load the local pipeline in the background unless a load was already tried."""
+    from hawk import local_image_gen
+
+    # main() preloads before Textual starts; if that failed, the first
+    # generation reports the error rather than a silent retry here
+    if local_image_gen.is_available() and not local_image_gen.preload_attempted():
+        local_image_gen.preload_model()
+
+
 class SplashScreen(Screen):
     """Splash screen with HawkTUI branding."""
 
@@ -73,6 +87,17 @@ class SplashScreen(Screen):
             )
         )
 
+    def on_mount(self) -> None:
+        """Overlap the local model load with the time spent on the splash."""
+        if USE_LOCAL_IMAGE_GEN:
+            # Importing torch/diffusers holds the GIL for a while, so let the
+            # splash paint its first frame before the warmup thread starts
+            self.call_after_refresh(self._start_warmup)
+
+    def _start_warmup(self) -> None:
+        # Daemon so quitting mid-download doesn't wait for the load to finish
+        threading.Thread(target=_warm_local_model, name="hawk-warmup", daemon=True).start()
+
     def action_continue(self) -> None:
         """Continue to main app."""
         self.dismiss()